@@ -42,8 +42,12 @@ func newRootCmd() *cobra.Command {
 		"Namespace for the ConfigMap (auto-detected from service account when empty)")
 	f.Bool("daemon", true,
 		"Run continuously; set to false to exit after one sync")
+	f.Bool("watch", false,
+		"In daemon mode, rescan on HTTPRoute/Namespace watch events instead of polling")
 	f.Int("scan-interval", 300,
 		"Seconds between scans in daemon mode")
+	f.Int("max-interval", 0,
+		"Upper bound in seconds for backing off the scan interval while nothing changes (disabled when not above scan-interval)")
 	f.String("log-level", "info",
 		"Log verbosity: debug, info, warn, error")
 	f.String("title", "Home Dashboard",
@@ -53,7 +57,7 @@ func newRootCmd() *cobra.Command {
 	f.Int("columns", 5,
 		"Number of service columns in the Homer layout")
 	f.String("template-path", "",
-		"Path to a custom Go template file; falls back to the built-in template when empty")
+		"Path to a custom Go template file; falls back to the built-in layout when empty")
 
 	// Bind each flag to its canonical env var, preserving backward compatibility
 	// with the Python-era variable names.
@@ -71,7 +75,9 @@ func newRootCmd() *cobra.Command {
 	bindEnv("configmap-name", "HOMER_SYNC_CONFIGMAP_NAME")
 	bindEnv("configmap-namespace", "HOMER_SYNC_CONFIGMAP_NAMESPACE")
 	bindEnv("daemon", "HOMER_SYNC_DAEMON_MODE")
+	bindEnv("watch", "HOMER_SYNC_WATCH")
 	bindEnv("scan-interval", "HOMER_SYNC_SCAN_INTERVAL")
+	bindEnv("max-interval", "HOMER_SYNC_MAX_INTERVAL")
 	bindEnv("log-level", "HOMER_SYNC_LOG_LEVEL")
 	bindEnv("title", "HOMER_SYNC_TITLE")
 	bindEnv("subtitle", "HOMER_SYNC_SUBTITLE")
@@ -91,7 +97,9 @@ func runE(cmd *cobra.Command, _ []string) error {
 
 	slog.Info("homer-sync starting",
 		"daemon", cfg.Daemon,
+		"watch", cfg.Watch,
 		"interval", cfg.ScanInterval,
+		"max_interval", cfg.MaxInterval,
 		"gateways", cfg.GatewayNames,
 		"domain_suffixes", cfg.DomainSuffixes,
 	)
@@ -132,7 +140,9 @@ func buildConfig() (*config.Config, error) {
 		ConfigMapName:      viper.GetString("configmap-name"),
 		ConfigMapNamespace: ns,
 		Daemon:             viper.GetBool("daemon"),
+		Watch:              viper.GetBool("watch"),
 		ScanInterval:       viper.GetInt("scan-interval"),
+		MaxInterval:        viper.GetInt("max-interval"),
 		LogLevel:           config.ParseLogLevel(viper.GetString("log-level")),
 		Title:              viper.GetString("title"),
 		Subtitle:           viper.GetString("subtitle"),
@@ -11,6 +11,17 @@ const (
 	saNamespaceFile  = "/var/run/secrets/kubernetes.io/serviceaccount/namespace"
 )
 
+// Annotation keys read from HTTPRoutes and Namespaces.
+const (
+	AnnotationEnabled   = AnnotationPrefix + "/enabled"
+	AnnotationGroup     = AnnotationPrefix + "/group"
+	AnnotationGroupIcon = AnnotationPrefix + "/group-icon"
+	AnnotationName      = AnnotationPrefix + "/name"
+	AnnotationSubtitle  = AnnotationPrefix + "/subtitle"
+	AnnotationIcon      = AnnotationPrefix + "/icon"
+	AnnotationSort      = AnnotationPrefix + "/sort"
+)
+
 // Config holds all runtime configuration for homer-sync.
 type Config struct {
 	GatewayNames       []string
@@ -18,7 +29,9 @@ type Config struct {
 	ConfigMapName      string
 	ConfigMapNamespace string
 	Daemon             bool
+	Watch              bool
 	ScanInterval       int
+	MaxInterval        int
 	LogLevel           slog.Level
 	Title              string
 	Subtitle           string
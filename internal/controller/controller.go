@@ -2,16 +2,25 @@ package controller
 
 import (
 	"context"
-	"crypto/sha256"
+	"encoding/binary"
 	"fmt"
+	"hash/maphash"
 	"log/slog"
+	"math/rand/v2"
+	"os"
 	"sort"
 	"strings"
+	"sync"
+	"sync/atomic"
+	"text/template"
 	"time"
 
-	corev1 "k8s.io/api/core/v1"
-	"k8s.io/apimachinery/pkg/api/errors"
 	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
+	"k8s.io/apimachinery/pkg/labels"
+	corev1ac "k8s.io/client-go/applyconfigurations/core/v1"
+	corelisters "k8s.io/client-go/listers/core/v1"
+	gatewayv1 "sigs.k8s.io/gateway-api/apis/v1"
+	gatewaylisters "sigs.k8s.io/gateway-api/pkg/client/listers/apis/v1"
 
 	"github.com/mirceanton/homer-sync/internal/config"
 	"github.com/mirceanton/homer-sync/internal/k8s"
@@ -32,206 +41,407 @@ type ServiceItem struct {
 type Controller struct {
 	clients *k8s.Clients
 	cfg     *config.Config
+
+	// gateways is cfg.GatewayNames as a set for constant-time parentRef checks.
+	gateways map[string]struct{}
+
+	// tmpl is the custom template and tmplModTime the modification time of
+	// the file it was parsed from. It is re-parsed only when the file changes.
+	tmpl        *template.Template
+	tmplModTime time.Time
+
+	// configMapRV is the ConfigMap resourceVersion returned by the last
+	// apply, used to tell whether an apply actually changed anything.
+	configMapRV string
+
+	// lastState fingerprints the namespaces and HTTPRoutes behind the last
+	// successful sync and lastRendered is the config rendered from them;
+	// stateKnown reports whether both have been set.
+	lastState    uint64
+	lastRendered string
+	stateKnown   bool
+
+	// In watch mode nsLister and routeLister serve scans from the informer
+	// caches. nsIndex is rebuilt from nsLister only when nsDirty is set by a
+	// namespace event.
+	nsLister    corelisters.NamespaceLister
+	routeLister gatewaylisters.HTTPRouteLister
+	nsIndex     *namespaceIndex
+	nsDirty     atomic.Bool
+
+	// debug caches whether debug logging is enabled for the current scan, so
+	// per-route log arguments are only built when they will be emitted.
+	debug bool
 }
 
 // New returns a Controller ready to run.
 func New(clients *k8s.Clients, cfg *config.Config) *Controller {
-	return &Controller{clients: clients, cfg: cfg}
+	gateways := make(map[string]struct{}, len(cfg.GatewayNames))
+	for _, g := range cfg.GatewayNames {
+		gateways[g] = struct{}{}
+	}
+	return &Controller{clients: clients, cfg: cfg, gateways: gateways}
 }
 
-// Run starts the controller. In daemon mode it loops indefinitely; otherwise it
-// runs once and returns.
+// Run starts the controller. In daemon mode it loops indefinitely, either
+// polling or reacting to watch events; otherwise it runs once and returns.
 func (c *Controller) Run(ctx context.Context) error {
+	if c.cfg.Daemon && c.cfg.Watch {
+		return c.runWatch(ctx)
+	}
 	if c.cfg.Daemon {
+		unchangedRuns := 0
 		for {
 			if err := ctx.Err(); err != nil {
 				return nil
 			}
-			if err := c.runOnce(ctx); err != nil {
+			changed, err := c.runOnce(ctx)
+			switch {
+			case err != nil:
 				slog.Error("unhandled error during scan; will retry after interval", "error", err)
+				unchangedRuns = 0
+			case changed:
+				unchangedRuns = 0
+			default:
+				unchangedRuns++
 			}
+
+			interval := c.pollInterval(unchangedRuns)
+			slog.Debug("next scan scheduled", "in", interval)
 			select {
 			case <-ctx.Done():
 				return nil
-			case <-time.After(time.Duration(c.cfg.ScanInterval) * time.Second):
+			case <-time.After(interval):
 			}
 		}
 	}
-	return c.runOnce(ctx)
+	_, err := c.runOnce(ctx)
+	return err
+}
+
+// pollInterval returns the delay before the next scan. Each consecutive scan
+// that left the ConfigMap unchanged doubles the scan interval, capped at
+// MaxInterval. Up to 10% of the scan interval is added as jitter so replicas
+// do not scan in lockstep.
+func (c *Controller) pollInterval(unchangedRuns int) time.Duration {
+	base := time.Duration(c.cfg.ScanInterval) * time.Second
+	interval := base
+	if limit := time.Duration(c.cfg.MaxInterval) * time.Second; limit > base {
+		for i := 0; i < unchangedRuns && interval < limit; i++ {
+			interval *= 2
+		}
+		interval = min(interval, limit)
+	}
+	if jitter := int64(base / 10); jitter > 0 {
+		interval += time.Duration(rand.Int64N(jitter))
+	}
+	return interval
 }
 
 // ---------------------------------------------------------------------------
 // Single scan cycle
 // ---------------------------------------------------------------------------
 
-func (c *Controller) runOnce(ctx context.Context) error {
+// runOnce performs a single scan and reports whether the ConfigMap was
+// written.
+func (c *Controller) runOnce(ctx context.Context) (bool, error) {
 	slog.Info("starting scan")
-
-	nsMap, err := c.fetchNamespaces(ctx)
-	if err != nil {
-		return fmt.Errorf("fetch namespaces: %w", err)
+	c.debug = slog.Default().Enabled(ctx, slog.LevelDebug)
+
+	// The two lists are independent, so fetch them concurrently.
+	var (
+		wg              sync.WaitGroup
+		nsIndex         *namespaceIndex
+		routes          []route
+		nsErr, routeErr error
+	)
+	wg.Add(2)
+	go func() {
+		defer wg.Done()
+		nsIndex, nsErr = c.fetchNamespaces(ctx)
+	}()
+	go func() {
+		defer wg.Done()
+		routes, routeErr = c.fetchHTTPRoutes(ctx)
+	}()
+	wg.Wait()
+
+	if nsErr != nil {
+		return false, fmt.Errorf("fetch namespaces: %w", nsErr)
 	}
-
-	routes, err := c.fetchHTTPRoutes(ctx)
-	if err != nil {
-		return fmt.Errorf("fetch httproutes: %w", err)
+	if routeErr != nil {
+		return false, fmt.Errorf("fetch httproutes: %w", routeErr)
 	}
 	slog.Debug("found httproutes", "count", len(routes))
 
-	groupIconCache := make(map[string]string)
-	var items []ServiceItem
+	reloaded, err := c.loadTemplate()
+	if err != nil {
+		return false, fmt.Errorf("load template: %w", err)
+	}
+	if reloaded {
+		// The previous render came from a different template.
+		c.stateKnown = false
+	}
 
-	for _, route := range routes {
-		if !c.shouldInclude(route) {
-			continue
+	state := stateFingerprint(nsIndex, routes)
+	if c.stateKnown && state == c.lastState {
+		// Rendering would produce the same config, but it is still applied so
+		// that out-of-band edits to the ConfigMap are repaired.
+		slog.Info("cluster state unchanged; reusing previous render")
+		changed, err := c.syncConfigMap(ctx, c.lastRendered)
+		if err != nil {
+			return false, fmt.Errorf("sync configmap: %w", err)
 		}
-		item, ok := c.extractItem(route, nsMap, groupIconCache)
-		if ok {
+		return changed, nil
+	}
+
+	// At most one item per route; sizing up front avoids regrowing (and
+	// copying) the slice as items are appended.
+	items := make([]ServiceItem, 0, len(routes))
+	for i := range routes {
+		if item, ok := c.buildItem(&routes[i], nsIndex); ok {
 			items = append(items, item)
 		}
 	}
 
-	groups := make(map[string][]ServiceItem)
-	for _, item := range items {
-		groups[item.Group] = append(groups[item.Group], item)
-	}
-	for g := range groups {
-		sort.Slice(groups[g], func(i, j int) bool {
-			if groups[g][i].Sort != groups[g][j].Sort {
-				return groups[g][i].Sort < groups[g][j].Sort
-			}
-			return groups[g][i].Name < groups[g][j].Name
-		})
-	}
+	groups := groupItems(items)
 
 	slog.Info("collected services", "services", len(items), "groups", len(groups))
 
 	rendered, err := c.buildTemplateData(groups)
 	if err != nil {
-		return fmt.Errorf("render config: %w", err)
+		return false, fmt.Errorf("render config: %w", err)
 	}
 
-	if err := c.syncConfigMap(ctx, rendered); err != nil {
-		return fmt.Errorf("sync configmap: %w", err)
+	changed, err := c.syncConfigMap(ctx, rendered)
+	if err != nil {
+		return false, fmt.Errorf("sync configmap: %w", err)
 	}
+	c.lastState = state
+	c.lastRendered = rendered
+	c.stateKnown = true
 
 	slog.Info("scan complete")
-	return nil
+	return changed, nil
 }
 
 // ---------------------------------------------------------------------------
 // Kubernetes helpers
 // ---------------------------------------------------------------------------
 
-// namespaceAnnotations is the annotation map for a single namespace.
-type namespaceAnnotations = map[string]string
+// listPageSize bounds the number of objects returned per list request so that
+// large clusters are fetched in chunks rather than one huge response.
+const listPageSize = 500
 
-func (c *Controller) fetchNamespaces(ctx context.Context) (map[string]namespaceAnnotations, error) {
-	nsMap := make(map[string]namespaceAnnotations)
-	list, err := c.clients.Core.CoreV1().Namespaces().List(ctx, metav1.ListOptions{})
+// fetchNamespaces returns the namespace index. In watch mode the index comes
+// from the informer cache and is only rebuilt after a namespace changed;
+// otherwise namespaces are listed from the API server.
+func (c *Controller) fetchNamespaces(ctx context.Context) (*namespaceIndex, error) {
+	if c.nsLister == nil {
+		return c.listNamespaces(ctx)
+	}
+	if !c.nsDirty.Swap(false) && c.nsIndex != nil {
+		return c.nsIndex, nil
+	}
+
+	namespaces, err := c.nsLister.List(labels.Everything())
 	if err != nil {
-		return nil, fmt.Errorf("list namespaces: %w", err)
+		c.nsDirty.Store(true)
+		return nil, fmt.Errorf("list cached namespaces: %w", err)
+	}
+	// Match API list order so the first namespace to claim a group name
+	// deterministically provides its icon.
+	sort.Slice(namespaces, func(i, j int) bool { return namespaces[i].Name < namespaces[j].Name })
+
+	idx := newNamespaceIndex()
+	for _, ns := range namespaces {
+		idx.add(ns.Name, ns.Annotations)
 	}
-	for _, ns := range list.Items {
-		ann := ns.Annotations
-		if ann == nil {
-			ann = make(map[string]string)
+	c.nsIndex = idx
+	return idx, nil
+}
+
+// listNamespaces lists namespaces for polling mode. ResourceVersion "0" lets
+// the API server answer from its watch cache instead of etcd; namespaces
+// change rarely, so slightly stale data is fine here.
+func (c *Controller) listNamespaces(ctx context.Context) (*namespaceIndex, error) {
+	idx := newNamespaceIndex()
+	opts := metav1.ListOptions{ResourceVersion: "0", Limit: listPageSize}
+	for {
+		list, err := c.clients.Core.CoreV1().Namespaces().List(ctx, opts)
+		if err != nil {
+			return nil, fmt.Errorf("list namespaces: %w", err)
+		}
+		for _, ns := range list.Items {
+			idx.add(ns.Name, ns.Annotations)
 		}
-		nsMap[ns.Name] = ann
+		if list.Continue == "" {
+			return idx, nil
+		}
+		// A continue token already pins the snapshot; the API server rejects
+		// it combined with a resourceVersion.
+		opts.ResourceVersion = ""
+		opts.Continue = list.Continue
 	}
-	return nsMap, nil
 }
 
-func (c *Controller) fetchHTTPRoutes(ctx context.Context) ([]map[string]interface{}, error) {
-	list, err := c.clients.Gateway.GatewayV1().HTTPRoutes("").List(ctx, metav1.ListOptions{})
-	if err != nil {
-		return nil, fmt.Errorf("list httproutes: %w", err)
-	}
-
-	routes := make([]map[string]interface{}, 0, len(list.Items))
-	for _, r := range list.Items {
-		// Build a minimal map that mirrors the Python dict structure so we
-		// can share the same annotation-processing logic.
-		parentRefs := make([]map[string]interface{}, 0, len(r.Spec.ParentRefs))
-		for _, pr := range r.Spec.ParentRefs {
-			parentRefs = append(parentRefs, map[string]interface{}{
-				"name": string(pr.Name),
-			})
+// fetchHTTPRoutes returns all HTTPRoutes, from the informer cache in watch
+// mode and from the API server otherwise.
+func (c *Controller) fetchHTTPRoutes(ctx context.Context) ([]route, error) {
+	if c.routeLister != nil {
+		cached, err := c.routeLister.List(labels.Everything())
+		if err != nil {
+			return nil, fmt.Errorf("list cached httproutes: %w", err)
 		}
-		hostnames := make([]string, 0, len(r.Spec.Hostnames))
-		for _, h := range r.Spec.Hostnames {
-			hostnames = append(hostnames, string(h))
+		// Match API list order so the state fingerprint and item tie-breaking
+		// are stable across scans.
+		sort.Slice(cached, func(i, j int) bool {
+			if cached[i].Namespace != cached[j].Namespace {
+				return cached[i].Namespace < cached[j].Namespace
+			}
+			return cached[i].Name < cached[j].Name
+		})
+		routes := make([]route, 0, len(cached))
+		for _, r := range cached {
+			routes = append(routes, toRoute(r))
 		}
+		return routes, nil
+	}
 
-		ann := r.Annotations
-		if ann == nil {
-			ann = make(map[string]string)
+	var routes []route
+	opts := metav1.ListOptions{Limit: listPageSize}
+	for {
+		list, err := c.clients.Gateway.GatewayV1().HTTPRoutes("").List(ctx, opts)
+		if err != nil {
+			return nil, fmt.Errorf("list httproutes: %w", err)
+		}
+		for i := range list.Items {
+			routes = append(routes, toRoute(&list.Items[i]))
 		}
+		if list.Continue == "" {
+			return routes, nil
+		}
+		opts.Continue = list.Continue
+	}
+}
 
-		routes = append(routes, map[string]interface{}{
-			"namespace":   r.Namespace,
-			"name":        r.Name,
-			"annotations": ann,
-			"parentRefs":  parentRefs,
-			"hostnames":   hostnames,
-		})
+// route is the subset of an HTTPRoute that homer-sync reads.
+type route struct {
+	Namespace       string
+	Name            string
+	ResourceVersion string
+	// Annotations may be nil; reads from a nil map are safe, so no empty map
+	// is allocated for unannotated routes.
+	Annotations map[string]string
+	Gateways    []string // parentRef names
+	Hostnames   []string
+}
+
+// toRoute converts a typed HTTPRoute to a route.
+func toRoute(r *gatewayv1.HTTPRoute) route {
+	gateways := make([]string, len(r.Spec.ParentRefs))
+	for i, pr := range r.Spec.ParentRefs {
+		gateways[i] = string(pr.Name)
+	}
+	hostnames := make([]string, len(r.Spec.Hostnames))
+	for i, h := range r.Spec.Hostnames {
+		hostnames[i] = string(h)
+	}
+
+	return route{
+		Namespace:       r.Namespace,
+		Name:            r.Name,
+		ResourceVersion: r.ResourceVersion,
+		Annotations:     r.Annotations,
+		Gateways:        gateways,
+		Hostnames:       hostnames,
 	}
-	return routes, nil
 }
 
 // ---------------------------------------------------------------------------
-// Filtering
+// Filtering and item extraction
 // ---------------------------------------------------------------------------
 
-func (c *Controller) shouldInclude(route map[string]interface{}) bool {
-	ann := routeAnnotations(route)
-	enabled := strings.ToLower(ann[config.AnnotationPrefix+"/enabled"])
-	ns := route["namespace"].(string)
-	name := route["name"].(string)
+// buildItem applies the configured filters to route and, when it is included,
+// resolves its dashboard entry. Both steps share a single read of the route's
+// fields.
+func (c *Controller) buildItem(r *route, nsIndex *namespaceIndex) (ServiceItem, bool) {
+	ann := r.Annotations
+	filtered := c.cfg.HasFilters()
 
-	if c.cfg.HasFilters() {
+	// Opt-in mode: only include if explicitly enabled. Most routes carry no
+	// annotations at all, so reject those before reading anything else.
+	if !filtered && (len(ann) == 0 || !strings.EqualFold(ann[config.AnnotationEnabled], "true")) {
+		return ServiceItem{}, false
+	}
+
+	hostnames := r.Hostnames
+	ns, name := r.Namespace, r.Name
+
+	if filtered {
 		// Opt-out mode: include unless explicitly disabled.
-		if enabled == "false" {
-			slog.Debug("excluding route: disabled by annotation", "namespace", ns, "name", name)
-			return false
+		if len(ann) > 0 && strings.EqualFold(ann[config.AnnotationEnabled], "false") {
+			if c.debug {
+				slog.Debug("excluding route: disabled by annotation", "namespace", ns, "name", name)
+			}
+			return ServiceItem{}, false
 		}
 
-		if len(c.cfg.GatewayNames) > 0 {
-			if !matchesGateway(route, c.cfg.GatewayNames) {
-				slog.Debug("excluding route: no matching gateway", "namespace", ns, "name", name, "gateways", c.cfg.GatewayNames)
-				return false
+		if len(c.gateways) > 0 {
+			if !matchesGateway(r.Gateways, c.gateways) {
+				if c.debug {
+					slog.Debug("excluding route: no matching gateway", "namespace", ns, "name", name, "gateways", c.cfg.GatewayNames)
+				}
+				return ServiceItem{}, false
 			}
 		}
 
 		if len(c.cfg.DomainSuffixes) > 0 {
-			if !matchesDomainSuffix(route, c.cfg.DomainSuffixes) {
-				slog.Debug("excluding route: no hostname matches suffixes", "namespace", ns, "name", name, "suffixes", c.cfg.DomainSuffixes)
-				return false
+			if !matchesDomainSuffix(hostnames, c.cfg.DomainSuffixes) {
+				if c.debug {
+					slog.Debug("excluding route: no hostname matches suffixes", "namespace", ns, "name", name, "suffixes", c.cfg.DomainSuffixes)
+				}
+				return ServiceItem{}, false
 			}
 		}
+	}
 
-		return true
+	if len(hostnames) == 0 {
+		slog.Warn("skipping route: no hostnames defined", "namespace", ns, "name", name)
+		return ServiceItem{}, false
+	}
+
+	group := nsIndex.groupName(ns)
+	if override, ok := ann[config.AnnotationGroup]; ok && override != "" {
+		group = override
 	}
 
-	// Opt-in mode: only include if explicitly enabled.
-	return enabled == "true"
+	sortVal := 0
+	if sv, ok := ann[config.AnnotationSort]; ok && sv != "" {
+		fmt.Sscanf(sv, "%d", &sortVal)
+	}
+
+	return ServiceItem{
+		Name:      stringOr(ann[config.AnnotationName], name),
+		Subtitle:  ann[config.AnnotationSubtitle],
+		URL:       "https://" + hostnames[0],
+		Icon:      ann[config.AnnotationIcon],
+		Group:     group,
+		GroupIcon: nsIndex.groupIcon(group),
+		Sort:      sortVal,
+	}, true
 }
 
-func matchesGateway(route map[string]interface{}, names []string) bool {
-	refs, _ := route["parentRefs"].([]map[string]interface{})
-	for _, ref := range refs {
-		n, _ := ref["name"].(string)
-		for _, want := range names {
-			if n == want {
-				return true
-			}
+func matchesGateway(refs []string, gateways map[string]struct{}) bool {
+	for _, n := range refs {
+		if _, ok := gateways[n]; ok {
+			return true
 		}
 	}
 	return false
 }
 
-func matchesDomainSuffix(route map[string]interface{}, suffixes []string) bool {
-	hostnames, _ := route["hostnames"].([]string)
+func matchesDomainSuffix(hostnames []string, suffixes []string) bool {
 	for _, h := range hostnames {
 		for _, s := range suffixes {
 			if strings.HasSuffix(h, s) {
@@ -243,62 +453,58 @@ func matchesDomainSuffix(route map[string]interface{}, suffixes []string) bool {
 }
 
 // ---------------------------------------------------------------------------
-// Item extraction
+// Namespace helpers
 // ---------------------------------------------------------------------------
 
-func (c *Controller) extractItem(
-	route map[string]interface{},
-	nsMap map[string]namespaceAnnotations,
-	groupIconCache map[string]string,
-) (ServiceItem, bool) {
-	ann := routeAnnotations(route)
-	ns := route["namespace"].(string)
-	name := route["name"].(string)
+const defaultGroupIcon = "fas fa-globe"
 
-	hostnames, _ := route["hostnames"].([]string)
-	if len(hostnames) == 0 {
-		slog.Warn("skipping route: no hostnames defined", "namespace", ns, "name", name)
-		return ServiceItem{}, false
-	}
-	url := "https://" + hostnames[0]
-
-	nsAnn := nsMap[ns]
+// namespaceIndex holds the Homer group metadata resolved once per scan, so
+// route extraction only needs map lookups.
+type namespaceIndex struct {
+	groups      map[string]string // namespace name → group name
+	iconByGroup map[string]string // group name → icon of the first namespace using it
+	state       maphash.Hash      // fingerprint of the indexed namespaces, in insertion order
+}
 
-	var group string
-	if override, ok := ann[config.AnnotationPrefix+"/group"]; ok && override != "" {
-		group = override
-		if _, seen := groupIconCache[group]; !seen {
-			groupIconCache[group] = resolveGroupIconForName(group, nsMap)
-		}
-	} else {
-		group = namespaceGroupName(ns, nsAnn)
-		if _, seen := groupIconCache[group]; !seen {
-			groupIconCache[group] = namespaceGroupIcon(nsAnn)
-		}
+func newNamespaceIndex() *namespaceIndex {
+	idx := &namespaceIndex{
+		groups:      make(map[string]string),
+		iconByGroup: make(map[string]string),
 	}
+	idx.state.SetSeed(stateSeed)
+	return idx
+}
 
-	sortVal := 0
-	if sv, ok := ann[config.AnnotationPrefix+"/sort"]; ok && sv != "" {
-		fmt.Sscanf(sv, "%d", &sortVal)
+func (idx *namespaceIndex) add(ns string, ann map[string]string) {
+	group := namespaceGroupName(ns, ann)
+	icon := namespaceGroupIcon(ann)
+	idx.groups[ns] = group
+	if _, seen := idx.iconByGroup[group]; !seen {
+		idx.iconByGroup[group] = icon
 	}
+	writeFields(&idx.state, ns, group, icon)
+}
 
-	return ServiceItem{
-		Name:      stringOr(ann[config.AnnotationPrefix+"/name"], name),
-		Subtitle:  ann[config.AnnotationPrefix+"/subtitle"],
-		URL:       url,
-		Icon:      ann[config.AnnotationPrefix+"/icon"],
-		Group:     group,
-		GroupIcon: groupIconCache[group],
-		Sort:      sortVal,
-	}, true
+// groupName returns the group for a namespace, falling back to the title-cased
+// namespace name when the namespace is unknown.
+func (idx *namespaceIndex) groupName(ns string) string {
+	if group, ok := idx.groups[ns]; ok {
+		return group
+	}
+	return namespaceGroupName(ns, nil)
 }
 
-// ---------------------------------------------------------------------------
-// Namespace helpers
-// ---------------------------------------------------------------------------
+// groupIcon returns the icon for a group name, falling back to the default
+// icon when no namespace resolves to that group.
+func (idx *namespaceIndex) groupIcon(group string) string {
+	if icon, ok := idx.iconByGroup[group]; ok {
+		return icon
+	}
+	return defaultGroupIcon
+}
 
 func namespaceGroupName(ns string, ann map[string]string) string {
-	if override, ok := ann[config.AnnotationPrefix+"/group"]; ok && override != "" {
+	if override, ok := ann[config.AnnotationGroup]; ok && override != "" {
 		return override
 	}
 	return titleCase(strings.ReplaceAll(ns, "-", " "))
@@ -317,118 +523,153 @@ func titleCase(s string) string {
 }
 
 func namespaceGroupIcon(ann map[string]string) string {
-	if icon, ok := ann[config.AnnotationPrefix+"/group-icon"]; ok && icon != "" {
+	if icon, ok := ann[config.AnnotationGroupIcon]; ok && icon != "" {
 		return icon
 	}
-	return "fas fa-globe"
-}
-
-// resolveGroupIconForName walks all namespaces to find the first whose group
-// name matches the provided group, then returns its icon.
-func resolveGroupIconForName(group string, nsMap map[string]namespaceAnnotations) string {
-	for ns, ann := range nsMap {
-		if namespaceGroupName(ns, ann) == group {
-			return namespaceGroupIcon(ann)
-		}
-	}
-	return "fas fa-globe"
+	return defaultGroupIcon
 }
 
 // ---------------------------------------------------------------------------
 // Template rendering
 // ---------------------------------------------------------------------------
 
-func (c *Controller) buildTemplateData(groups map[string][]ServiceItem) (string, error) {
-	// Sort groups alphabetically (mirrors Jinja2's dictsort).
-	groupNames := make([]string, 0, len(groups))
-	for g := range groups {
-		groupNames = append(groupNames, g)
-	}
-	sort.Strings(groupNames)
-
-	groupData := make([]GroupData, 0, len(groupNames))
-	for _, gName := range groupNames {
-		items := groups[gName]
-		icon := ""
-		if len(items) > 0 {
-			icon = items[0].GroupIcon
+// groupItems sorts items by group, sort order and name in a single pass and
+// splits them into consecutive groups. Groups are ordered alphabetically and
+// share the sorted slice's backing array, so items are not copied. The stable
+// sort keeps ties in API list order, which keeps the rendered output (and thus
+// the ConfigMap) identical across scans of an unchanged cluster.
+func groupItems(items []ServiceItem) []GroupData {
+	sort.SliceStable(items, func(i, j int) bool {
+		a, b := &items[i], &items[j]
+		if a.Group != b.Group {
+			return a.Group < b.Group
 		}
-		gd := GroupData{
-			Name: gName,
-			Icon: icon,
+		if a.Sort != b.Sort {
+			return a.Sort < b.Sort
 		}
-		for _, si := range items {
-			gd.Items = append(gd.Items, si)
+		return a.Name < b.Name
+	})
+
+	var groups []GroupData
+	for start := 0; start < len(items); {
+		end := start + 1
+		for end < len(items) && items[end].Group == items[start].Group {
+			end++
 		}
-		groupData = append(groupData, gd)
+		groups = append(groups, GroupData{
+			Name:  items[start].Group,
+			Icon:  items[start].GroupIcon,
+			Items: items[start:end:end],
+		})
+		start = end
 	}
+	return groups
+}
 
+// buildTemplateData renders the Homer config for groups, using the custom
+// template when one is configured and the built-in layout otherwise.
+func (c *Controller) buildTemplateData(groups []GroupData) (string, error) {
 	data := TemplateData{
 		Title:    c.cfg.Title,
 		Subtitle: c.cfg.Subtitle,
 		Columns:  c.cfg.Columns,
-		Groups:   groupData,
+		Groups:   groups,
+	}
+	if c.cfg.TemplatePath == "" {
+		return renderBuiltin(data)
+	}
+
+	return renderConfig(c.tmpl, data)
+}
+
+// loadTemplate parses the custom template on first use and again whenever the
+// file's modification time changes, so edits (e.g. to a mounted ConfigMap) are
+// picked up on the next scan without a restart. It reports whether a new
+// template was loaded.
+func (c *Controller) loadTemplate() (bool, error) {
+	if c.cfg.TemplatePath == "" {
+		return false, nil
 	}
-	return renderConfig(data, c.cfg.TemplatePath)
+	info, err := os.Stat(c.cfg.TemplatePath)
+	if err != nil {
+		return false, fmt.Errorf("stat custom template %q: %w", c.cfg.TemplatePath, err)
+	}
+	if c.tmpl != nil && info.ModTime().Equal(c.tmplModTime) {
+		return false, nil
+	}
+
+	tmpl, err := parseTemplate(c.cfg.TemplatePath)
+	if err != nil {
+		return false, err
+	}
+	c.tmpl = tmpl
+	c.tmplModTime = info.ModTime()
+	slog.Debug("loaded custom template", "path", c.cfg.TemplatePath)
+	return true, nil
 }
 
 // ---------------------------------------------------------------------------
 // ConfigMap sync
 // ---------------------------------------------------------------------------
 
-func (c *Controller) syncConfigMap(ctx context.Context, rendered string) error {
+// fieldManager identifies homer-sync as the owner of the fields it applies.
+const fieldManager = "homer-sync"
+
+// syncConfigMap server-side applies the rendered config, which creates or
+// updates the ConfigMap in a single request. Applying unchanged content is a
+// no-op on the server, so applying every scan also repairs a ConfigMap that was
+// deleted or edited out of band. It reports whether the apply changed the
+// object.
+func (c *Controller) syncConfigMap(ctx context.Context, rendered string) (bool, error) {
 	name := c.cfg.ConfigMapName
 	ns := c.cfg.ConfigMapNamespace
-	hash := contentHash(rendered)
 
-	existing, err := c.clients.Core.CoreV1().ConfigMaps(ns).Get(ctx, name, metav1.GetOptions{})
-	if err != nil && !errors.IsNotFound(err) {
-		return fmt.Errorf("get configmap %s/%s: %w", ns, name, err)
-	}
-
-	if errors.IsNotFound(err) {
-		cm := &corev1.ConfigMap{
-			ObjectMeta: metav1.ObjectMeta{
-				Name:      name,
-				Namespace: ns,
-			},
-			Data: map[string]string{"config.yml": rendered},
-		}
-		if _, err := c.clients.Core.CoreV1().ConfigMaps(ns).Create(ctx, cm, metav1.CreateOptions{}); err != nil {
-			return fmt.Errorf("create configmap %s/%s: %w", ns, name, err)
-		}
-		slog.Info("created configmap", "namespace", ns, "name", name)
-		return nil
+	cm := corev1ac.ConfigMap(name, ns).WithData(map[string]string{"config.yml": rendered})
+	opts := metav1.ApplyOptions{FieldManager: fieldManager, Force: true}
+	applied, err := c.clients.Core.CoreV1().ConfigMaps(ns).Apply(ctx, cm, opts)
+	if err != nil {
+		return false, fmt.Errorf("apply configmap %s/%s: %w", ns, name, err)
 	}
 
-	// Skip update if content is unchanged.
-	if contentHash(existing.Data["config.yml"]) == hash {
+	if applied.ResourceVersion == c.configMapRV {
 		slog.Debug("configmap already up to date", "namespace", ns, "name", name)
-		return nil
+		return false, nil
 	}
-
-	existing.Data = map[string]string{"config.yml": rendered}
-	if _, err := c.clients.Core.CoreV1().ConfigMaps(ns).Update(ctx, existing, metav1.UpdateOptions{}); err != nil {
-		return fmt.Errorf("update configmap %s/%s: %w", ns, name, err)
-	}
-	slog.Info("updated configmap", "namespace", ns, "name", name)
-	return nil
+	c.configMapRV = applied.ResourceVersion
+	slog.Info("applied configmap", "namespace", ns, "name", name)
+	return true, nil
 }
 
 // ---------------------------------------------------------------------------
 // Small utilities
 // ---------------------------------------------------------------------------
 
-func contentHash(s string) string {
-	return fmt.Sprintf("%x", sha256.Sum256([]byte(s)))
+// stateSeed seeds every state fingerprint so they are comparable within the
+// process.
+var stateSeed = maphash.MakeSeed()
+
+// stateFingerprint summarises the fetched cluster state. Any change to an
+// HTTPRoute bumps its resourceVersion, and additions or deletions change the
+// list, so an equal fingerprint means the rendered config would be identical.
+func stateFingerprint(nsIndex *namespaceIndex, routes []route) uint64 {
+	var h maphash.Hash
+	h.SetSeed(stateSeed)
+	for i := range routes {
+		writeFields(&h, routes[i].Namespace, routes[i].Name, routes[i].ResourceVersion)
+	}
+	var nsState [8]byte
+	binary.LittleEndian.PutUint64(nsState[:], nsIndex.state.Sum64())
+	h.Write(nsState[:])
+	return h.Sum64()
 }
 
-func routeAnnotations(route map[string]interface{}) map[string]string {
-	ann, _ := route["annotations"].(map[string]string)
-	if ann == nil {
-		return make(map[string]string)
+// writeFields feeds NUL-terminated fields into h so that adjacent values
+// cannot run into each other.
+func writeFields(h *maphash.Hash, fields ...string) {
+	for _, f := range fields {
+		h.WriteString(f)
+		h.WriteByte(0)
 	}
-	return ann
 }
 
 func stringOr(s, fallback string) string {
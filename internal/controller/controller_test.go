@@ -0,0 +1,116 @@
+package controller
+
+import (
+	"testing"
+	"time"
+
+	"github.com/mirceanton/homer-sync/internal/config"
+)
+
+func TestPollInterval(t *testing.T) {
+	tests := []struct {
+		name          string
+		maxInterval   int
+		unchangedRuns int
+		want          time.Duration
+	}{
+		{name: "first unchanged run", maxInterval: 60, unchangedRuns: 0, want: 10 * time.Second},
+		{name: "doubles once", maxInterval: 60, unchangedRuns: 1, want: 20 * time.Second},
+		{name: "doubles twice", maxInterval: 60, unchangedRuns: 2, want: 40 * time.Second},
+		{name: "capped at max interval", maxInterval: 60, unchangedRuns: 3, want: 60 * time.Second},
+		{name: "stays at max interval", maxInterval: 60, unchangedRuns: 10, want: 60 * time.Second},
+		{name: "disabled when unset", maxInterval: 0, unchangedRuns: 5, want: 10 * time.Second},
+		{name: "disabled when equal to scan interval", maxInterval: 10, unchangedRuns: 5, want: 10 * time.Second},
+		{name: "disabled when below scan interval", maxInterval: 5, unchangedRuns: 5, want: 10 * time.Second},
+	}
+
+	const base = 10 * time.Second
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			c := &Controller{cfg: &config.Config{ScanInterval: 10, MaxInterval: tt.maxInterval}}
+			// Jitter is random, so sample enough times to catch values
+			// outside [want, want+base/10).
+			for i := 0; i < 100; i++ {
+				got := c.pollInterval(tt.unchangedRuns)
+				if got < tt.want || got >= tt.want+base/10 {
+					t.Fatalf("pollInterval(%d) = %s, want in [%s, %s)", tt.unchangedRuns, got, tt.want, tt.want+base/10)
+				}
+			}
+		})
+	}
+}
+
+func TestStateFingerprint(t *testing.T) {
+	type namespace struct {
+		name string
+		ann  map[string]string
+	}
+	baseNamespaces := []namespace{
+		{name: "media", ann: map[string]string{config.AnnotationGroup: "Media", config.AnnotationGroupIcon: "fas fa-film"}},
+		{name: "tools"},
+	}
+	baseRoutes := []route{
+		{Namespace: "media", Name: "jellyfin", ResourceVersion: "100"},
+		{Namespace: "tools", Name: "grafana", ResourceVersion: "200"},
+	}
+
+	fingerprint := func(namespaces []namespace, routes []route) uint64 {
+		idx := newNamespaceIndex()
+		for _, ns := range namespaces {
+			idx.add(ns.name, ns.ann)
+		}
+		return stateFingerprint(idx, routes)
+	}
+	base := fingerprint(baseNamespaces, baseRoutes)
+
+	if got := fingerprint(baseNamespaces, baseRoutes); got != base {
+		t.Fatalf("identical state gave fingerprint %x, want %x", got, base)
+	}
+
+	withAnnotations := func(ann map[string]string) []namespace {
+		return []namespace{{name: "media", ann: ann}, baseNamespaces[1]}
+	}
+
+	tests := []struct {
+		name       string
+		namespaces []namespace
+		routes     []route
+	}{
+		{
+			name:       "route resourceVersion changed",
+			namespaces: baseNamespaces,
+			routes: []route{
+				{Namespace: "media", Name: "jellyfin", ResourceVersion: "101"},
+				baseRoutes[1],
+			},
+		},
+		{
+			name:       "namespace group changed",
+			namespaces: withAnnotations(map[string]string{config.AnnotationGroup: "Movies", config.AnnotationGroupIcon: "fas fa-film"}),
+			routes:     baseRoutes,
+		},
+		{
+			name:       "namespace group icon changed",
+			namespaces: withAnnotations(map[string]string{config.AnnotationGroup: "Media", config.AnnotationGroupIcon: "fas fa-tv"}),
+			routes:     baseRoutes,
+		},
+		{
+			name:       "route added",
+			namespaces: baseNamespaces,
+			routes:     append(append([]route(nil), baseRoutes...), route{Namespace: "tools", Name: "prometheus", ResourceVersion: "300"}),
+		},
+		{
+			name:       "route removed",
+			namespaces: baseNamespaces,
+			routes:     baseRoutes[:1],
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := fingerprint(tt.namespaces, tt.routes); got == base {
+				t.Errorf("fingerprint unchanged (%x)", got)
+			}
+		})
+	}
+}
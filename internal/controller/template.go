@@ -1,17 +1,15 @@
 package controller
 
 import (
-	_ "embed"
-	"bytes"
 	"fmt"
 	"os"
+	"strings"
 	"text/template"
-)
 
-//go:embed default.tmpl
-var defaultTemplate string
+	"gopkg.in/yaml.v3"
+)
 
-// TemplateData is the context passed to the Homer config template.
+// TemplateData is the context passed to a custom Homer config template.
 type TemplateData struct {
 	Title    string
 	Subtitle string
@@ -26,30 +24,116 @@ type GroupData struct {
 	Items []ServiceItem
 }
 
-// renderConfig executes the Homer config template against data and returns the
-// rendered YAML string.  When templatePath is non-empty and the file exists it
-// is used as the template; otherwise the built-in default is used.
-func renderConfig(data TemplateData, templatePath string) (string, error) {
-	var src string
-
-	if templatePath != "" {
-		raw, err := os.ReadFile(templatePath)
-		if err != nil {
-			return "", fmt.Errorf("read custom template %q: %w", templatePath, err)
-		}
-		src = string(raw)
-	} else {
-		src = defaultTemplate
+// parseTemplate loads and parses a custom Homer config template.
+func parseTemplate(templatePath string) (*template.Template, error) {
+	raw, err := os.ReadFile(templatePath)
+	if err != nil {
+		return nil, fmt.Errorf("read custom template %q: %w", templatePath, err)
 	}
 
-	tmpl, err := template.New("homer").Parse(src)
+	tmpl, err := template.New("homer").Parse(string(raw))
 	if err != nil {
-		return "", fmt.Errorf("parse template: %w", err)
+		return nil, fmt.Errorf("parse template: %w", err)
 	}
+	return tmpl, nil
+}
 
-	var buf bytes.Buffer
+// renderConfig executes the Homer config template against data and returns the
+// rendered YAML string. The template writes straight into a strings.Builder so
+// the result is not copied again when converted to a string.
+func renderConfig(tmpl *template.Template, data TemplateData) (string, error) {
+	var buf strings.Builder
 	if err := tmpl.Execute(&buf, data); err != nil {
 		return "", fmt.Errorf("execute template: %w", err)
 	}
 	return buf.String(), nil
 }
+
+// ---------------------------------------------------------------------------
+// Built-in config
+// ---------------------------------------------------------------------------
+
+// homerConfig is the built-in Homer config.yml layout. Field order matches the
+// order keys are written in.
+type homerConfig struct {
+	Title             string        `yaml:"title"`
+	Subtitle          string        `yaml:"subtitle"`
+	Header            bool          `yaml:"header"`
+	Footer            bool          `yaml:"footer"`
+	Columns           int           `yaml:"columns"`
+	ConnectivityCheck bool          `yaml:"connectivityCheck"`
+	Links             []string      `yaml:"links"`
+	Services          homerServices `yaml:"services"`
+}
+
+// homerServices encodes an empty list as null, matching the output of the
+// original template.
+type homerServices []homerService
+
+func (s homerServices) MarshalYAML() (interface{}, error) {
+	if len(s) == 0 {
+		return nil, nil
+	}
+	return []homerService(s), nil
+}
+
+type homerService struct {
+	Name  string      `yaml:"name"`
+	Icon  string      `yaml:"icon"`
+	Items []homerItem `yaml:"items"`
+}
+
+type homerItem struct {
+	Name     string `yaml:"name"`
+	Subtitle string `yaml:"subtitle"`
+	URL      string `yaml:"url"`
+	Target   string `yaml:"target"`
+	Logo     string `yaml:"logo,omitempty"`
+}
+
+// renderBuiltin encodes the built-in Homer config directly as YAML, skipping
+// template parsing and execution. Unlike string templating it also escapes
+// values such as titles containing quotes.
+func renderBuiltin(data TemplateData) (string, error) {
+	cfg := homerConfig{
+		Title:             data.Title,
+		Subtitle:          data.Subtitle,
+		Header:            true,
+		Footer:            false,
+		Columns:           data.Columns,
+		ConnectivityCheck: true,
+		Links:             []string{},
+		Services:          make(homerServices, 0, len(data.Groups)),
+	}
+	for _, g := range data.Groups {
+		svc := homerService{
+			Name:  g.Name,
+			Icon:  g.Icon,
+			Items: make([]homerItem, 0, len(g.Items)),
+		}
+		for _, si := range g.Items {
+			item := homerItem{
+				Name:     si.Name,
+				Subtitle: si.Subtitle,
+				URL:      si.URL,
+				Target:   "_blank",
+			}
+			if si.Icon != "" {
+				item.Logo = "assets/icons/" + si.Icon + ".svg"
+			}
+			svc.Items = append(svc.Items, item)
+		}
+		cfg.Services = append(cfg.Services, svc)
+	}
+
+	var buf strings.Builder
+	enc := yaml.NewEncoder(&buf)
+	enc.SetIndent(2)
+	if err := enc.Encode(cfg); err != nil {
+		return "", fmt.Errorf("encode config: %w", err)
+	}
+	if err := enc.Close(); err != nil {
+		return "", fmt.Errorf("encode config: %w", err)
+	}
+	return buf.String(), nil
+}
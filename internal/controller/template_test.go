@@ -0,0 +1,140 @@
+package controller
+
+import (
+	"reflect"
+	"strings"
+	"testing"
+	"text/template"
+
+	"gopkg.in/yaml.v3"
+)
+
+// legacyTemplate is the embedded template renderBuiltin replaced.
+const legacyTemplate = `---
+title: "{{ .Title }}"
+subtitle: "{{ .Subtitle }}"
+header: true
+footer: false
+columns: {{ .Columns }}
+connectivityCheck: true
+
+links: []
+
+services:
+{{- range .Groups }}
+  - name: "{{ .Name }}"
+    icon: "{{ .Icon }}"
+    items:
+{{- range .Items }}
+      - name: "{{ .Name }}"
+        subtitle: "{{ .Subtitle }}"
+        url: "{{ .URL }}"
+        target: "_blank"
+{{- if .Icon }}
+        logo: "assets/icons/{{ .Icon }}.svg"
+{{- end }}
+{{- end }}
+{{- end }}`
+
+func renderLegacy(t *testing.T, data TemplateData) string {
+	t.Helper()
+	tmpl := template.Must(template.New("homer").Parse(legacyTemplate))
+	var buf strings.Builder
+	if err := tmpl.Execute(&buf, data); err != nil {
+		t.Fatalf("execute legacy template: %v", err)
+	}
+	return buf.String()
+}
+
+func parseYAML(t *testing.T, s string) map[string]interface{} {
+	t.Helper()
+	var out map[string]interface{}
+	if err := yaml.Unmarshal([]byte(s), &out); err != nil {
+		t.Fatalf("parse rendered config: %v\n%s", err, s)
+	}
+	return out
+}
+
+func TestRenderBuiltinMatchesLegacyTemplate(t *testing.T) {
+	media := []ServiceItem{
+		{Name: "Jellyfin", Subtitle: "Media server", URL: "https://jellyfin.example.com", Icon: "jellyfin", Group: "Media", GroupIcon: "fas fa-film", Sort: 1},
+		{Name: "Sonarr", URL: "https://sonarr.example.com", Group: "Media", GroupIcon: "fas fa-film", Sort: 2},
+	}
+
+	tests := []struct {
+		name string
+		data TemplateData
+	}{
+		{
+			name: "groups with and without item icons",
+			data: TemplateData{
+				Title:    "Home Dashboard",
+				Subtitle: "",
+				Columns:  5,
+				Groups:   []GroupData{{Name: "Media", Icon: "fas fa-film", Items: media}},
+			},
+		},
+		{
+			name: "no groups",
+			data: TemplateData{Title: "Home Dashboard", Columns: 3},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			got, err := renderBuiltin(tt.data)
+			if err != nil {
+				t.Fatalf("renderBuiltin: %v", err)
+			}
+			want := parseYAML(t, renderLegacy(t, tt.data))
+			if parsed := parseYAML(t, got); !reflect.DeepEqual(parsed, want) {
+				t.Errorf("renderBuiltin mismatch\ngot:\n%s\nwant:\n%s", got, renderLegacy(t, tt.data))
+			}
+		})
+	}
+}
+
+func TestRenderBuiltinEscapesQuotes(t *testing.T) {
+	data := TemplateData{
+		Title:    `My "Home" Lab`,
+		Subtitle: "",
+		Columns:  5,
+		Groups: []GroupData{{
+			Name:  `Bob's "Media"`,
+			Icon:  "fas fa-film",
+			Items: []ServiceItem{{Name: `Say "hi"`, URL: "https://hi.example.com"}},
+		}},
+	}
+
+	got, err := renderBuiltin(data)
+	if err != nil {
+		t.Fatalf("renderBuiltin: %v", err)
+	}
+	parsed := parseYAML(t, got)
+
+	if parsed["title"] != data.Title {
+		t.Errorf("title = %q, want %q", parsed["title"], data.Title)
+	}
+	if parsed["subtitle"] != "" {
+		t.Errorf("subtitle = %q, want empty", parsed["subtitle"])
+	}
+	services, _ := parsed["services"].([]interface{})
+	if len(services) != 1 {
+		t.Fatalf("services = %v, want one group", parsed["services"])
+	}
+	group, _ := services[0].(map[string]interface{})
+	if group["name"] != data.Groups[0].Name {
+		t.Errorf("group name = %q, want %q", group["name"], data.Groups[0].Name)
+	}
+	items, _ := group["items"].([]interface{})
+	if len(items) != 1 {
+		t.Fatalf("items = %v, want one item", group["items"])
+	}
+	item, _ := items[0].(map[string]interface{})
+	if item["name"] != `Say "hi"` {
+		t.Errorf("item name = %q, want %q", item["name"], `Say "hi"`)
+	}
+	if _, ok := item["logo"]; ok {
+		t.Errorf("item without icon has logo %q", item["logo"])
+	}
+}
@@ -0,0 +1,170 @@
+package controller
+
+import (
+	"context"
+	"fmt"
+	"log/slog"
+	"maps"
+	"time"
+
+	corev1 "k8s.io/api/core/v1"
+	"k8s.io/client-go/informers"
+	"k8s.io/client-go/tools/cache"
+	gatewayv1 "sigs.k8s.io/gateway-api/apis/v1"
+	gatewayinformers "sigs.k8s.io/gateway-api/pkg/client/informers/externalversions"
+
+	"github.com/mirceanton/homer-sync/internal/config"
+)
+
+const (
+	// watchDebounce coalesces bursts of events (e.g. a Helm release touching
+	// many HTTPRoutes) into a single rescan.
+	watchDebounce = 2 * time.Second
+	// watchResync is the safety-net interval at which a full rescan runs even
+	// when no events were received.
+	watchResync = time.Hour
+	// cacheSyncTimeout bounds the initial informer list. Without the watch verb
+	// the informers never sync, so fail loudly instead of waiting forever.
+	cacheSyncTimeout = 2 * time.Minute
+)
+
+// runWatch rescans whenever an HTTPRoute or a namespace's grouping changes,
+// instead of polling on a fixed interval.
+func (c *Controller) runWatch(ctx context.Context) error {
+	trigger := make(chan struct{}, 1)
+	notify := func() {
+		select {
+		case trigger <- struct{}{}:
+		default:
+		}
+	}
+
+	if err := c.startInformers(ctx, notify); err != nil {
+		return err
+	}
+	if ctx.Err() != nil {
+		return nil
+	}
+
+	var retryDelay time.Duration
+	for {
+		// retry stays nil (never fires) unless the scan failed.
+		var retry <-chan time.Time
+		if _, err := c.runOnce(ctx); err != nil {
+			retryDelay = c.nextRetryDelay(retryDelay)
+			slog.Error("unhandled error during scan; will retry", "error", err, "in", retryDelay)
+			retry = time.After(retryDelay)
+		} else {
+			retryDelay = 0
+		}
+
+		select {
+		case <-ctx.Done():
+			return nil
+		case <-retry:
+		case <-time.After(watchResync):
+			slog.Debug("periodic resync")
+		case <-trigger:
+			select {
+			case <-ctx.Done():
+				return nil
+			case <-time.After(watchDebounce):
+			}
+			// Events that arrived during the debounce window are covered by
+			// the scan we are about to run.
+			select {
+			case <-trigger:
+			default:
+			}
+		}
+	}
+}
+
+// nextRetryDelay returns the wait before retrying a failed scan in watch mode.
+// It starts at watchDebounce and doubles on each consecutive failure, capped
+// at the scan interval.
+func (c *Controller) nextRetryDelay(prev time.Duration) time.Duration {
+	if prev == 0 {
+		return watchDebounce
+	}
+	limit := max(time.Duration(c.cfg.ScanInterval)*time.Second, watchDebounce)
+	return min(prev*2, limit)
+}
+
+// startInformers keeps in-memory copies of all namespaces and HTTPRoutes up to
+// date via list+watch, so scans read from cache instead of the API server.
+// The informers' reflectors relist and resume on their own when a watch
+// expires (410 Gone). notify is called whenever a change can affect the
+// rendered config.
+func (c *Controller) startInformers(ctx context.Context, notify func()) error {
+	coreFactory := informers.NewSharedInformerFactory(c.clients.Core, 0)
+	nsInformer := coreFactory.Core().V1().Namespaces()
+
+	gatewayFactory := gatewayinformers.NewSharedInformerFactory(c.clients.Gateway, 0)
+	routeInformer := gatewayFactory.Gateway().V1().HTTPRoutes()
+
+	nsChanged := func() {
+		c.nsDirty.Store(true)
+		notify()
+	}
+	_, err := nsInformer.Informer().AddEventHandler(cache.ResourceEventHandlerDetailedFuncs{
+		AddFunc: func(_ interface{}, isInInitialList bool) {
+			if !isInInitialList {
+				nsChanged()
+			}
+		},
+		UpdateFunc: func(oldObj, newObj interface{}) {
+			o, okOld := oldObj.(*corev1.Namespace)
+			n, okNew := newObj.(*corev1.Namespace)
+			if okOld && okNew &&
+				o.Annotations[config.AnnotationGroup] == n.Annotations[config.AnnotationGroup] &&
+				o.Annotations[config.AnnotationGroupIcon] == n.Annotations[config.AnnotationGroupIcon] {
+				return
+			}
+			nsChanged()
+		},
+		DeleteFunc: func(interface{}) { nsChanged() },
+	})
+	if err != nil {
+		return fmt.Errorf("register namespace handler: %w", err)
+	}
+
+	_, err = routeInformer.Informer().AddEventHandler(cache.ResourceEventHandlerDetailedFuncs{
+		AddFunc: func(_ interface{}, isInInitialList bool) {
+			if !isInInitialList {
+				notify()
+			}
+		},
+		UpdateFunc: func(oldObj, newObj interface{}) {
+			// Status-only updates (e.g. from the gateway controller) bump the
+			// resourceVersion but cannot change the dashboard.
+			o, okOld := oldObj.(*gatewayv1.HTTPRoute)
+			n, okNew := newObj.(*gatewayv1.HTTPRoute)
+			if okOld && okNew && o.Generation == n.Generation && maps.Equal(o.Annotations, n.Annotations) {
+				return
+			}
+			notify()
+		},
+		DeleteFunc: func(interface{}) { notify() },
+	})
+	if err != nil {
+		return fmt.Errorf("register httproute handler: %w", err)
+	}
+
+	coreFactory.Start(ctx.Done())
+	gatewayFactory.Start(ctx.Done())
+
+	syncCtx, cancel := context.WithTimeout(ctx, cacheSyncTimeout)
+	defer cancel()
+	if !cache.WaitForCacheSync(syncCtx.Done(), nsInformer.Informer().HasSynced, routeInformer.Informer().HasSynced) {
+		if ctx.Err() != nil {
+			return nil
+		}
+		return fmt.Errorf("informer caches did not sync within %s; check that the service account can list and watch namespaces and httproutes", cacheSyncTimeout)
+	}
+
+	c.nsLister = nsInformer.Lister()
+	c.routeLister = routeInformer.Lister()
+	c.nsDirty.Store(true)
+	return nil
+}
@@ -3,6 +3,7 @@ package k8s
 import (
 	"fmt"
 
+	"k8s.io/apimachinery/pkg/runtime"
 	"k8s.io/client-go/kubernetes"
 	"k8s.io/client-go/rest"
 	"k8s.io/client-go/tools/clientcmd"
@@ -29,7 +30,14 @@ func NewClients() (*Clients, error) {
 		}
 	}
 
-	core, err := kubernetes.NewForConfig(cfg)
+	// Core resources support protobuf, which is much cheaper to decode than
+	// JSON. HTTPRoute is a CRD and only speaks JSON, so the Gateway client
+	// keeps the default content type.
+	coreCfg := rest.CopyConfig(cfg)
+	coreCfg.AcceptContentTypes = runtime.ContentTypeProtobuf + "," + runtime.ContentTypeJSON
+	coreCfg.ContentType = runtime.ContentTypeProtobuf
+
+	core, err := kubernetes.NewForConfig(coreCfg)
 	if err != nil {
 		return nil, fmt.Errorf("create core client: %w", err)
 	}